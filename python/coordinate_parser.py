@@ -1,5 +1,13 @@
 import re
-from math import floor, log10
+from array import array
+from functools import lru_cache
+
+# Patterns used on every conversion, compiled once at import.
+_EPOCH_RE = re.compile(r'\b[Jj]\s*2000\.?0?\b\s*')
+_CASA_DEC_RE = re.compile(r'^([+\-])(\d{1,3})\.(\d{1,2})\.(\d{1,2}(\.\d+)?)$')
+
+# h/m/s, d/m/s and colon separators all become whitespace before splitting
+_HMS_TRANSLATE = {ord(c): ' ' for c in 'hHdD°mM\'sS":'}
 
 def determine_precision(value_str):
     """Count decimal places in value_str, e.g. '12.345' -> 3."""
@@ -7,6 +15,11 @@ def determine_precision(value_str):
         return 0
     return len(value_str.split('.')[-1])
 
+# Conversions are pure functions of their (hashable) arguments, so repeated
+# coordinates, e.g. when cross-matching catalogs, are served from the cache.
+# Use ra_dec_converter.cache_clear() / .cache_info() to manage it.
+# typed=True keeps e.g. ra_precision=2 and 2.0 apart, since they format differently.
+@lru_cache(maxsize=65536, typed=True)
 def ra_dec_converter(
     input_string,
     input_format='hmsdms',   # 'hmsdms', 'degrees', or 'casa'
@@ -16,11 +29,15 @@ def ra_dec_converter(
     ra_only=False,
     dec_only=False,
     ra_precision=None,
-    dec_precision=None
+    dec_precision=None,
+    return_tuple=False       # with output_format='degrees': (ra, dec) floats
 ):
-    # Debug: Show inputs
-    #print(f"[DEBUG] ra_dec_converter() called with input_string='{input_string}',"
-          #f" input_format='{input_format}', output_format='{output_format}'")
+    if return_tuple:
+        if output_format != 'degrees' or ra_only or dec_only:
+            raise ValueError("return_tuple needs output_format='degrees' and both axes")
+        # Full-precision floats: no formatting, so the precision options don't apply
+        ra_val, _, dec_val, _ = _parse_ra_dec(input_string, input_format)
+        return ra_val, dec_val
 
     # Decide delimiter defaults
     if internal_delimiter is None:
@@ -29,94 +46,249 @@ def ra_dec_converter(
         else:
             internal_delimiter = ' '  # for 'degrees' or 'casa'
 
-    # Clean input
+    # Single-axis output: parse, check and format only the axis asked for
+    if ra_only or dec_only:
+        is_ra = bool(ra_only)
+        val, inprec = _parse_axis(input_string, input_format, is_ra)
+        precision = ra_precision if is_ra else dec_precision
+        if precision is None:
+            precision = inprec
+        if is_ra:
+            return _format_ra(val, precision, output_format, internal_delimiter)
+        return _format_dec(val, precision, output_format, internal_delimiter)
+
+    ra_val, ra_inprec, dec_val, dec_inprec = _parse_ra_dec(input_string, input_format)
+    return _format_ra_dec(ra_val, ra_inprec, dec_val, dec_inprec,
+                          output_format, internal_delimiter, ra_dec_delimiter,
+                          ra_precision, dec_precision)
+
+
+def _clean_input(input_string):
+    """Strip whitespace and any J2000 epoch marker."""
     input_string = input_string.strip()
-    # Remove epoch markers
-    input_string = re.sub(r'\b[Jj]\s*2000\.?0?\b\s*', '', input_string).strip()
+    # Most inputs carry no epoch marker; skip the regex for them
+    if '2000' in input_string:
+        input_string = _EPOCH_RE.sub('', input_string).strip()
+    return input_string
+
+
+def _parse_ra_dec(input_string, input_format):
+    """
+    Parse a coordinate string into range-checked degrees plus the decimal
+    places seen in the input: (ra_val, ra_inprec, dec_val, dec_inprec).
+    """
+    return _parse_cleaned(_clean_input(input_string), input_format)
+
+
+# Parsing does not depend on the output options, so the same input converted
+# to several formats or precisions is only parsed once. The cache is keyed on
+# the cleaned string, so 'J2000 12:34:56 +45:23:45' and '12:34:56 +45:23:45'
+# share an entry.
+@lru_cache(maxsize=65536)
+def _parse_cleaned(input_string, input_format):
+    # Fast path: plain "float float" decimal degrees skip the split/parse helpers
+    parsed = None
+    if input_format == 'degrees' and ':' not in input_string:
+        parts = input_string.replace(',', ' ').split()
+        if len(parts) == 2:
+            try:
+                parsed = (float(parts[0]), determine_precision(parts[0]),
+                          float(parts[1]), determine_precision(parts[1]))
+            except ValueError:
+                pass  # fall through to the general path for the usual error
+
+    if parsed is None:
+        # 1) Split RA/Dec
+        ra_part, dec_part = split_ra_dec(input_string, input_format)
+
+        # 2) Convert RA => degrees
+        ra_val, ra_inprec = parse_to_degrees(ra_part, is_ra=True, input_format=input_format)
+        # 3) Convert Dec => degrees
+        dec_val, dec_inprec = parse_to_degrees(dec_part, is_ra=False, input_format=input_format)
+        parsed = (ra_val, ra_inprec, dec_val, dec_inprec)
+
+    validate_ranges(parsed[0], parsed[2])
+    return parsed
+
 
-    # 1) Split RA/Dec
-    ra_part, dec_part = split_ra_dec(input_string, input_format)
-    #print(f"[DEBUG] After split_ra_dec => ra_part='{ra_part}', dec_part='{dec_part}'")
+def _parse_axis(input_string, input_format, is_ra):
+    """
+    Like _parse_ra_dec for one axis only: returns (val, inprec). The other
+    axis is never parsed, and the input may hold just the wanted coordinate.
+    """
+    input_string = _clean_input(input_string)
+    ra_part, dec_part = split_ra_dec(input_string, input_format, allow_single=True)
+    if dec_part is None:
+        coord_str = ra_part  # only one coordinate given: it is the requested axis
+    else:
+        coord_str = ra_part if is_ra else dec_part
+
+    val, inprec = parse_to_degrees(coord_str, is_ra=is_ra, input_format=input_format)
+    if is_ra:
+        validate_ra(val)
+    else:
+        validate_dec(val)
+    return val, inprec
 
-    # 2) Convert RA => degrees
-    ra_val, ra_inprec = parse_to_degrees(ra_part, is_ra=True, input_format=input_format)
-    # 3) Convert Dec => degrees
-    dec_val, dec_inprec = parse_to_degrees(dec_part, is_ra=False, input_format=input_format)
 
-    #print(f"[DEBUG] parse_to_degrees => RA={ra_val:.6f} deg (inprec={ra_inprec}),"
-          #f" Dec={dec_val:.6f} deg (inprec={dec_inprec})")
+def validate_ranges(ra_val, dec_val):
+    validate_ra(ra_val)
+    validate_dec(dec_val)
 
-    # Validate range
+
+def validate_ra(ra_val):
     if not (0 <= ra_val < 360):
         raise ValueError(f"RA must be [0..360): {ra_val}")
+
+
+def validate_dec(dec_val):
     if not (-90 <= dec_val <= 90):
         raise ValueError(f"Dec must be [-90..+90]: {dec_val}")
 
+
+def _format_ra_dec(
+    ra_val, ra_inprec, dec_val, dec_inprec,
+    output_format, internal_delimiter, ra_dec_delimiter,
+    ra_precision, dec_precision
+):
+    """Format already range-checked RA/Dec degrees for output."""
     # 4) Decide final precision
     final_ra_precision = ra_precision if (ra_precision is not None) else ra_inprec
     final_dec_precision = dec_precision if (dec_precision is not None) else dec_inprec
 
-    #print(f"[DEBUG] final_ra_precision={final_ra_precision}, final_dec_precision={final_dec_precision}")
-
     # 5) Format output
+    ra_str = _format_ra(ra_val, final_ra_precision, output_format, internal_delimiter)
+    dec_str = _format_dec(dec_val, final_dec_precision, output_format, internal_delimiter)
+    return f"{ra_str}{ra_dec_delimiter}{dec_str}"
+
+
+def _format_ra(ra_val, precision, output_format, internal_delimiter):
     if output_format == 'degrees':
-        ra_str = format_degrees(ra_val, final_ra_precision, force_sign=False)
-        dec_str = format_degrees(dec_val, final_dec_precision, force_sign=True)
-        #print(f"[DEBUG] Output in degrees => RA='{ra_str}', Dec='{dec_str}'")
+        return format_degrees(ra_val, precision, force_sign=False)
     elif output_format == 'hmsdms':
-        ra_str = degrees_to_hms(ra_val, final_ra_precision, delimiter=internal_delimiter)
-        dec_str = degrees_to_dms(dec_val, final_dec_precision, delimiter=internal_delimiter)
-        #print(f"[DEBUG] Output in hmsdms => RA='{ra_str}', Dec='{dec_str}'")
+        return degrees_to_hms(ra_val, precision, delimiter=internal_delimiter)
     else:
         # 'casa'
-        ra_str = degrees_to_hms(ra_val, final_ra_precision, delimiter=':')
-        dec_str = degrees_to_casa_dec(dec_val, final_dec_precision)
-        #print(f"[DEBUG] Output in casa => RA='{ra_str}', Dec='{dec_str}'")
-
-    if ra_only:
-        return ra_str
-    elif dec_only:
-        return dec_str
+        return degrees_to_hms(ra_val, precision, delimiter=':')
+
+
+def _format_dec(dec_val, precision, output_format, internal_delimiter):
+    if output_format == 'degrees':
+        return format_degrees(dec_val, precision, force_sign=True)
+    elif output_format == 'hmsdms':
+        return degrees_to_dms(dec_val, precision, delimiter=internal_delimiter)
     else:
-        final_str = f"{ra_str}{ra_dec_delimiter}{dec_str}"
-        #print(f"[DEBUG] final_str='{final_str}'")
-        return final_str
+        # 'casa'
+        return degrees_to_casa_dec(dec_val, precision)
 
 
-def split_ra_dec(input_str, in_fmt):
-    input_str = input_str.strip()
-    # DEBUG
-    #print(f"[DEBUG] split_ra_dec() called with input_str='{input_str}', in_fmt='{in_fmt}'")
+def ra_dec_converter_batch(
+    input_strings,
+    input_format='hmsdms',
+    output_format='degrees',
+    internal_delimiter=None,
+    ra_dec_delimiter='\t',
+    ra_only=False,
+    dec_only=False,
+    ra_precision=None,
+    dec_precision=None
+):
+    """
+    Convert many coordinate strings with the same options, e.g. a catalog column.
+    Returns a list of output strings in input order; a bad row raises ValueError
+    just like ra_dec_converter.
+    """
+    # Resolve the delimiter default once instead of per row
+    if internal_delimiter is None:
+        internal_delimiter = ':' if output_format == 'hmsdms' else ' '
+
+    convert = ra_dec_converter
+    return [
+        convert(s, input_format, output_format, internal_delimiter, ra_dec_delimiter,
+                ra_only, dec_only, ra_precision, dec_precision)
+        for s in input_strings
+    ]
 
+
+def ra_dec_to_degrees_batch(input_strings, input_format='hmsdms'):
+    """
+    Parse a sequence of coordinate strings straight to decimal degrees.
+    Returns (ra, dec) as two array('d') columns, unformatted and at full
+    float precision; a bad row raises ValueError like ra_dec_converter.
+    """
+    n = len(input_strings)
+    # Preallocated flat double columns: no per-row Python float objects are kept
+    ra = array('d', bytes(8 * n))
+    dec = array('d', bytes(8 * n))
+    parse = _parse_ra_dec
+    for i, s in enumerate(input_strings):
+        ra[i], _, dec[i], _ = parse(s, input_format)
+    return ra, dec
+
+
+def split_ra_dec(input_str, in_fmt, allow_single=False):
+    """
+    Split into (ra_part, dec_part). With allow_single=True (ra_only/dec_only),
+    an input holding a single coordinate comes back as (coord, None).
+    """
+    input_str = input_str.strip()
     if in_fmt == 'casa':
-        parts = re.split(r'[,\s]+', input_str)
+        parts = input_str.replace(',', ' ').split()
+        if allow_single and len(parts) == 1:
+            return parts[0], None
         if len(parts) != 2:
             raise ValueError(f"Expected 2 tokens for CASA input: got {parts}")
         return parts[0], parts[1]
     elif in_fmt == 'hmsdms':
-        m = re.match(r'^(.*?)([+\-]\d.*)$', input_str.replace(',', ' '))
-        if m:
-            return m.group(1).strip(), m.group(2).strip()
+        split = split_at_sign(input_str.replace(',', ' '))
+        if split:
+            return split
         # fallback
-        parts = re.split(r'\s+', input_str)
+        parts = input_str.split()
         if len(parts) == 2:
             return parts[0], parts[1]
+        if allow_single and 0 < len(parts) <= 3:
+            # At most one coordinate's worth of fields (e.g. "12 34 56")
+            return input_str, None
         raise ValueError(f"Cannot split hmsdms input: '{input_str}'")
     else:
         # 'degrees'
-        parts = re.split(r'[,\s]+', input_str)
+        parts = input_str.replace(',', ' ').split()
         if len(parts) == 2:
             return parts[0], parts[1]
         # fallback sign-based
-        pat = re.compile(r'^(.*?)([+\-]\d.*)$')
-        m2 = pat.match(input_str)
-        if m2:
-            return m2.group(1).strip(), m2.group(2).strip()
+        split = split_at_sign(input_str)
+        if split and (split[0] or not allow_single):
+            return split
+        if allow_single and len(parts) == 1:
+            return parts[0], None
         raise ValueError(f"Cannot split degrees input: '{input_str}'")
 
 
+def split_at_sign(input_str):
+    """
+    Split before the first '+' or '-' that is followed by a digit, e.g.
+    '12:34:56+45:23:45' -> ('12:34:56', '+45:23:45'). Returns None if there is none.
+    """
+    n = len(input_str)
+    start = 0
+    while True:
+        plus = input_str.find('+', start)
+        minus = input_str.find('-', start)
+        if plus < 0:
+            i = minus
+        elif minus < 0:
+            i = plus
+        else:
+            i = min(plus, minus)
+        if i < 0:
+            return None
+        if i + 1 < n and input_str[i + 1].isdigit():
+            return input_str[:i].strip(), input_str[i:].strip()
+        start = i + 1
+
+
 def parse_to_degrees(coord_str, is_ra, input_format):
-    #print(f"[DEBUG] parse_to_degrees() coord_str='{coord_str}', is_ra={is_ra}, input_format='{input_format}'")
     coord_str = coord_str.strip()
 
     if input_format == 'casa':
@@ -165,8 +337,7 @@ def parse_ra_colon_strict(ra_str):
 
 def parse_casa_dotted_dec(dec_str):
     dec_str = dec_str.strip()
-    pattern = re.compile(r'^([+\-])(\d{1,3})\.(\d{1,2})\.(\d{1,2}(\.\d+)?)$')
-    m = pattern.match(dec_str)
+    m = _CASA_DEC_RE.match(dec_str)
     if not m:
         raise ValueError(f"Invalid CASA dec: '{dec_str}' (should be ±DD.MM.SS(.ss))")
     sign_char, d, mm, ss_str, _ = m.groups()
@@ -182,14 +353,8 @@ def parse_casa_dotted_dec(dec_str):
 def parse_hms_or_dms(coord_str):
     """
     Convert e.g. '12h34m56.7s' or '351:14:45.00' into (h_or_d, m, s).
-    We add debug prints to see what the final tokens are.
     """
-    #print(f"[DEBUG] parse_hms_or_dms() => coord_str='{coord_str}'")
-    cleaned = re.sub(r'[hHdD°mM\'sS"]', ' ', coord_str)
-    #print(f"[DEBUG] after removing h/m/s/d => '{cleaned}'")
-    tokens = re.split(r'[:\s]+', cleaned.strip())
-    tokens = [t for t in tokens if t]
-    #print(f"[DEBUG] tokens={tokens}")
+    tokens = coord_str.translate(_HMS_TRANSLATE).split()
     if len(tokens) == 0:
         return ('0', '0', '0')
     elif len(tokens) == 1:
@@ -201,7 +366,6 @@ def parse_hms_or_dms(coord_str):
 
 
 def hms_to_degrees(h, m, s):
-    #print(f"[DEBUG] hms_to_degrees(h={h}, m={m}, s={s})")
     hh = float(h)
     mm = float(m)
     ss = float(s)
@@ -212,19 +376,14 @@ def hms_to_degrees(h, m, s):
     if not (0 <= ss < 60):
         raise ValueError(f"Seconds out of range [0..60): {ss}")
     val = hh + mm/60.0 + ss/3600.0
-    #print(f"[DEBUG] => hours={val:.6f} (decimal hours), => deg(=val*15 if RA)")
     return val
 
 def dms_to_degrees(d, m, s):
-    #print(f"[DEBUG] dms_to_degrees(d={d}, m={m}, s={s})")
-    sign = 1
     d_str = d.strip()
-    if d_str.startswith('-'):
-        sign = -1
-        d_str = d_str[1:]
-    elif d_str.startswith('+'):
-        d_str = d_str[1:]
-    dd = float(d_str) if d_str else 0.0
+    # float() accepts a leading sign itself; take the sign from the string so
+    # that '-00' (float -0.0) still gives a negative Dec
+    sign = -1 if d_str.startswith('-') else 1
+    dd = abs(float(d_str))
     mm = float(m)
     ss = float(s)
     if not (0 <= mm < 60):
@@ -233,7 +392,6 @@ def dms_to_degrees(d, m, s):
         raise ValueError(f"Seconds out of range [0..60): {ss}")
     deg_val = dd + mm/60.0 + ss/3600.0
     deg_val_signed = sign*deg_val
-    #print(f"[DEBUG] => deg_val={deg_val_signed:.6f}")
     return deg_val_signed
 
 def format_degrees(value, precision, force_sign=False):
@@ -241,7 +399,6 @@ def format_degrees(value, precision, force_sign=False):
         out = f"{value:+.{precision}f}"
     else:
         out = f"{value:.{precision}f}"
-    #print(f"[DEBUG] format_degrees(value={value}, precision={precision}, force_sign={force_sign}) => '{out}'")
     return out
 
 def degrees_to_hms(deg_val, precision=2, delimiter=':'):
@@ -252,14 +409,9 @@ def degrees_to_hms(deg_val, precision=2, delimiter=':'):
     remainder = remainder * 60 - mm
     ss = remainder * 60
 
-    # Round it once at high precision or do it inside helper
-    # but two_digit_left also calls round. So we do not double-round.
-    if precision > 0:
-        s_str = two_digit_left(ss, precision)
-    else:
-        s_str = f"{int(round(ss)):02d}"
-
-    return f"{hh:02d}{delimiter}{mm:02d}{delimiter}{s_str}"
+    hh, mm, s_str = _round_seconds(hh, mm, ss, precision)
+    # 23:59:59.999 carries to 24:00:00.00, which is 00:00:00.00
+    return f"{hh % 24:02d}{delimiter}{mm:02d}{delimiter}{s_str}"
 
 
 def degrees_to_dms(deg_val, precision=2, delimiter=':'):
@@ -271,63 +423,39 @@ def degrees_to_dms(deg_val, precision=2, delimiter=':'):
     remainder = remainder * 60 - mm
     ss = remainder * 60
 
-    if precision > 0:
-        s_str = two_digit_left(ss, precision)
-    else:
-        s_str = f"{int(round(ss)):02d}"
-
+    dd, mm, s_str = _round_seconds(dd, mm, ss, precision)
     return f"{sign}{dd:02d}{delimiter}{mm:02d}{delimiter}{s_str}"
 
 
 def degrees_to_casa_dec(deg_val, precision=2):
-    #print(f"[DEBUG] degrees_to_casa_dec(deg_val={deg_val:.6f}, precision={precision})")
     sign = '-' if deg_val<0 else '+'
     v = abs(deg_val)
     dd = int(v)
     remainder = v - dd
     mm = int(remainder*60)
     remainder = remainder*60 - mm
-    ss = round(remainder*60, precision)
-    if precision>0:
-        s_str = f"{ss:02.{precision}f}"
-    else:
-        s_str = f"{int(ss):02d}"
+    ss = remainder*60
+
+    dd, mm, s_str = _round_seconds(dd, mm, ss, precision)
+    return f"{sign}{dd:02d}.{mm:02d}.{s_str}"
 
-    d_str = f"{dd:02d}"
-    m_str = f"{mm:02d}"
-    out = f"{sign}{d_str}.{m_str}.{s_str}"
-    #print(f"[DEBUG] degrees_to_casa_dec => '{out}'")
-    return out
 
-def two_digit_left(value, precision):
+def _round_seconds(whole, mm, ss, precision):
     """
-    Convert 'value' (0 <= value < 60) into a string with exactly 2 digits 
-    to the left of the decimal, and 'precision' digits to the right.
-    Examples:
-      value=0.0,  precision=2 => '00.00'
-      value=8.9,  precision=2 => '08.90'
-      value=12.34,precision=2 => '12.34'
+    Round ss to 'precision' decimals and format it as 'SS.sss'. Seconds that
+    round up to 60 carry into the minutes, and minutes into whole
+    hours/degrees, so the output never shows ':60'.
+    Returns (whole, mm, seconds string).
     """
-    # Round to the given decimal places
-    val_rounded = round(value, precision)
-    
-    # Build normal float string with that many decimals
-    # e.g. "0.00", "8.90", "12.34"
-    base_str = f"{val_rounded:.{precision}f}"
-    
-    # If the integer part is only 1 digit, prepend '0'
-    # e.g. "8.90" => "08.90", "0.00" => "00.00"
-    if '.' in base_str:
-        int_part, frac_part = base_str.split('.')
-        if len(int_part) == 1:           # e.g. '8', '0'
-            return f"0{int_part}.{frac_part}"
-        else:
-            return base_str
-    else:
-        # if no '.', we only have an integer (precision=0). 
-        # e.g. "5" => "05"
-        if len(base_str) == 1:
-            return "0" + base_str
-        else:
-            return base_str
-
+    # Precision <= 0 means whole seconds, as it always has
+    precision = max(precision, 0)
+    ss = round(ss, precision)
+    if ss >= 60:
+        ss = 0.0
+        mm += 1
+        if mm == 60:
+            mm = 0
+            whole += 1
+    if precision == 0:
+        return whole, mm, f"{int(ss):02d}"
+    return whole, mm, f"{ss:0{precision + 3}.{precision}f}"
@@ -1,22 +1,74 @@
+import logging
 import unittest
 from math import isclose
-from coordinate_parser import ra_dec_converter
+from coordinate_parser import (
+    ra_dec_converter, ra_dec_converter_batch, ra_dec_to_degrees_batch,
+    _parse_ra_dec, _format_ra_dec,
+)
+
+log = logging.getLogger(__name__)
+
+
+# Reference coordinate shared by the whitespace and epoch-marker tests
+BASE_COORD = "12:34:56 +45:23:45"
+
+# Same coordinate as BASE_COORD with other whitespace between RA and Dec
+WHITESPACE_VARIATIONS = (
+    "12:34:56    +45:23:45",
+    "12:34:56\t+45:23:45",
+    "12:34:56\n+45:23:45",
+    "12:34:56  \t  +45:23:45",
+    "12:34:56\r\n+45:23:45",
+)
+
+EPOCH_MARKERS = ("J2000", "j2000", "J2000.0", "j2000.0", "J 2000", "j 2000.0")
+
+# (raw input, canonical zero-padded input)
+LEADING_ZERO_PAIRS = (
+    ("12:34:56 +45:23:45", "12:34:56 +45:23:45"),
+    ("02:34:56 +05:23:45", "02:34:56 +05:23:45"),
+    ("2:34:56 +5:23:45",   "02:34:56 +05:23:45"),
+)
+
+# (input, expected hmsdms output or None if it must raise ValueError)
+BOUNDARY_CASES = (
+    ("00:00:00.000 +00:00:00.000", "00:00:00.000\t+00:00:00.000"),
+    ("23:59:59.999 +89:59:59.999", "23:59:59.999\t+89:59:59.999"),
+    ("24:00:00.000 +00:00:00.000", None),
+    # +90 exactly is allowed, anything beyond is not
+    ("00:00:00.000 +90:00:00.000", "00:00:00.000\t+90:00:00.000"),
+    ("00:00:00.000 +90:00:00.001", None),
+    ("00:60:00.000 +00:00:00.000", None),
+    ("00:00:60.000 +00:00:00.000", None),
+)
+
 
 class TestCoordinateParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Convert the shared base coordinate once for the whole class
+        cls.base_hmsdms = ra_dec_converter(BASE_COORD, 'hmsdms', 'hmsdms',
+                                           ra_precision=2, dec_precision=2)
+        cls.base_degrees = ra_dec_converter(BASE_COORD, 'hmsdms', 'degrees', ra_dec_delimiter=', ')
+
     def assertCoordsEqual(self, coord1, coord2, input_format='hmsdms', rel_tol=1e-7):
         """
         Convert both coords to decimal degrees, compare (RA, Dec) with isclose.
         """
-        val1 = ra_dec_converter(coord1, input_format=input_format, output_format='degrees',
-                                ra_dec_delimiter=', ')
-        val2 = ra_dec_converter(coord2, input_format=input_format, output_format='degrees',
-                                ra_dec_delimiter=', ')
-        ra1, dec1 = map(float, val1.split(', '))
-        ra2, dec2 = map(float, val2.split(', '))
-        self.assertTrue(
-            isclose(ra1, ra2, rel_tol=rel_tol) and isclose(dec1, dec2, rel_tol=rel_tol),
-            f"Mismatch:\n  {coord1} -> ({ra1}, {dec1})\n  {coord2} -> ({ra2}, {dec2})"
-        )
+        ra1, dec1 = ra_dec_converter(coord1, input_format=input_format, output_format='degrees',
+                                     return_tuple=True)
+        self.assertCoordsEqualTo(ra1, dec1, coord2, input_format=input_format, rel_tol=rel_tol)
+
+    def assertCoordsEqualTo(self, ra_ref, dec_ref, coord, input_format='hmsdms', rel_tol=1e-7):
+        """
+        Like assertCoordsEqual, but against an already converted (RA, Dec) in degrees,
+        so a reference shared by several comparisons is only converted once.
+        """
+        ra, dec = ra_dec_converter(coord, input_format=input_format, output_format='degrees',
+                                   return_tuple=True)
+        # Only build the failure message when it is needed
+        if not (isclose(ra_ref, ra, rel_tol=rel_tol) and isclose(dec_ref, dec, rel_tol=rel_tol)):
+            self.fail(f"Mismatch:\n  reference -> ({ra_ref}, {dec_ref})\n  {coord} -> ({ra}, {dec})")
 
     def test_casa_format(self):
         """
@@ -52,10 +104,20 @@ class TestCoordinateParser(unittest.TestCase):
                                   ra_precision=2, dec_precision=3)
         # Expect RA ~ "09:54:56.82", Dec ~ "+17.43.31.404"? 
         # We'll just show how the test might look:
-        print("CASA OUTPUT = ", result)
+        log.debug("CASA OUTPUT = %s", result)
         self.assertIn("+17.", result)  # we see dotted dec
         self.assertIn(":", result)     # we see colons in RA
 
+        # (D) CASA input proper: input_format='casa' parses the dotted dec,
+        #     matching the colon form of the same coordinate
+        ra_ref, dec_ref = ra_dec_converter(standard, 'hmsdms', 'degrees', return_tuple=True)
+        self.assertCoordsEqualTo(ra_ref, dec_ref, dotted_casa, input_format='casa')
+        self.assertCoordsEqualTo(ra_ref, -dec_ref, "09:54:56.823626 -17.43.31.22243",
+                                 input_format='casa')
+        # A negative hour is rejected even when the minutes bring RA back into range
+        with self.assertRaises(ValueError):
+            ra_dec_converter("-0.5:59:00 +10.00.00.0", input_format='casa', output_format='hmsdms')
+
     def test_format_types(self):
         """Check an hmsdms coordinate vs. a degrees coordinate are consistent."""
         # If "351:14:45.00 +61:11:14.79" merges '4' and '45' => check we fixed it by properly splitting
@@ -63,31 +125,43 @@ class TestCoordinateParser(unittest.TestCase):
             ("23:24:59.00 +61:11:14.79", "351:14:45.00 +61:11:14.79"),
         ]
         for hms, deg in pairs:
-            h_degs = ra_dec_converter(hms, input_format='hmsdms', output_format='degrees', ra_dec_delimiter=', ')
-            d_degs = ra_dec_converter(deg, input_format='degrees', output_format='degrees', ra_dec_delimiter=', ')
-            ra1, dec1 = map(float, h_degs.split(', '))
-            ra2, dec2 = map(float, d_degs.split(', '))
-            self.assertTrue(isclose(ra1, ra2, rel_tol=1e-6),
-                            f"RA mismatch {ra1} vs. {ra2}")
-            self.assertTrue(isclose(dec1, dec2, rel_tol=1e-6),
-                            f"Dec mismatch {dec1} vs. {dec2}")
+            with self.subTest(hms=hms, deg=deg):
+                ra_ref, dec_ref = ra_dec_converter(hms, input_format='hmsdms', output_format='degrees',
+                                                   return_tuple=True)
+                self.assertCoordsEqualTo(ra_ref, dec_ref, deg, input_format='degrees', rel_tol=1e-6)
+
+    def test_format_equivalence(self):
+        """Different spellings of the same hmsdms coordinate give the same degrees."""
+        groups = [
+            ["12:34:56.78 +45:23:45.6", "12h34m56.78s +45d23m45.6s", "12 34 56.78 +45 23 45.6",
+             "12:34:56.78, +45:23:45.6", "J2000 12:34:56.78 +45:23:45.6"],
+            ["09:54:56.82 -17:43:31.2", "09h54m56.82s -17°43'31.2\"", "09 54 56.82 -17 43 31.2",
+             "9:54:56.82 -17:43:31.2"],
+        ]
+        for equiv_group in groups:
+            with self.subTest(base=equiv_group[0]):
+                # Convert the whole group once, then compare every row to the first
+                ra, dec = ra_dec_to_degrees_batch(equiv_group, 'hmsdms')
+                if not all(isclose(r, ra[0], rel_tol=1e-7) and isclose(d, dec[0], rel_tol=1e-7)
+                           for r, d in zip(ra, dec)):
+                    self.fail(f"Mismatch in {equiv_group}: RA {list(ra)}, Dec {list(dec)}")
 
     def test_delimiter_options(self):
         """
         E.g. user wants '18:04:20.99, -29:31:08.90' vs. '18:04:20.99, -29:31:8.90'.
         We ensure we do zero-padding -> '08.90', not '8.90'.
         """
-        print('TESTING DELIMITERS')
         coord = "18:04:20.99 -29:31:08.9"
         combos = [
             (", ", ":", "18:04:20.99, -29:31:08.90"),  
         ]
         for rd_del, int_del, expect in combos:
-            out = ra_dec_converter(coord, input_format='hmsdms', output_format='hmsdms',
-                                   ra_precision=2, dec_precision=2,
-                                   ra_dec_delimiter=rd_del, internal_delimiter=int_del)
-            print(f'Got output {out} compared to expected {expect}')
-            self.assertEqual(out, expect)
+            with self.subTest(ra_dec_delimiter=rd_del, internal_delimiter=int_del):
+                out = ra_dec_converter(coord, input_format='hmsdms', output_format='hmsdms',
+                                       ra_precision=2, dec_precision=2,
+                                       ra_dec_delimiter=rd_del, internal_delimiter=int_del)
+                log.debug("Got output %r compared to expected %r", out, expect)
+                self.assertEqual(out, expect)
 
 
 
@@ -100,9 +174,10 @@ class TestCoordinateParser(unittest.TestCase):
             ("12 +45", "12:00:00.00\t+45:00:00.00"),
         ]
         for inp, exp in cases:
-            out = ra_dec_converter(inp, input_format='hmsdms', output_format='hmsdms',
-                                   ra_precision=2, dec_precision=2)
-            self.assertEqual(out, exp)
+            with self.subTest(inp=inp):
+                out = ra_dec_converter(inp, input_format='hmsdms', output_format='hmsdms',
+                                       ra_precision=2, dec_precision=2)
+                self.assertEqual(out, exp)
 
     def test_precision_propagation(self):
         """
@@ -121,28 +196,32 @@ class TestCoordinateParser(unittest.TestCase):
             # Now we do specify => RA=4 decimals, Dec=5 decimals => check exactly that.
         ]
         
+        # Precision only affects formatting: parse each distinct input once
+        parsed = {inp: _parse_ra_dec(inp, 'hmsdms') for inp, *_ in cases}
         for (inp, ra_p, dec_p, mind, maxd) in cases:
-            out = ra_dec_converter(inp, 'hmsdms', 'degrees',
-                                   ra_precision=ra_p, dec_precision=dec_p)
-            ra_str, dec_str = out.split('\t')
-            # Count decimals
-            radec = 0 if '.' not in ra_str else len(ra_str.split('.')[-1])
-            decdec = 0 if '.' not in dec_str else len(dec_str.split('.')[-1])
+            with self.subTest(inp=inp, ra_precision=ra_p, dec_precision=dec_p):
+                out = _format_ra_dec(*parsed[inp], 'degrees', ' ', '\t', ra_p, dec_p)
+                self.assertEqual(out, ra_dec_converter(inp, 'hmsdms', 'degrees',
+                                                       ra_precision=ra_p, dec_precision=dec_p))
+                ra_str, _, dec_str = out.partition('\t')
+                # Count decimals
+                radec = len(ra_str.partition('.')[2])
+                decdec = len(dec_str.partition('.')[2])
             
-            # If ra_p is None => we allow a range. If ra_p is given => must match exactly.
-            if ra_p is None:
-                self.assertTrue(mind <= radec <= maxd,
-                                f"Expected RA decimals in [{mind}..{maxd}], got {radec}")
-            else:
-                self.assertEqual(radec, ra_p,
-                                 f"Expected RA decimals={ra_p}, got {radec}")
+                # If ra_p is None => we allow a range. If ra_p is given => must match exactly.
+                if ra_p is None:
+                    self.assertTrue(mind <= radec <= maxd,
+                                    f"Expected RA decimals in [{mind}..{maxd}], got {radec}")
+                else:
+                    self.assertEqual(radec, ra_p,
+                                     f"Expected RA decimals={ra_p}, got {radec}")
             
-            if dec_p is None:
-                self.assertTrue(mind <= decdec <= maxd,
-                                f"Expected Dec decimals in [{mind}..{maxd}], got {decdec}")
-            else:
-                self.assertEqual(decdec, dec_p,
-                                 f"Expected Dec decimals={dec_p}, got {decdec}")
+                if dec_p is None:
+                    self.assertTrue(mind <= decdec <= maxd,
+                                    f"Expected Dec decimals in [{mind}..{maxd}], got {decdec}")
+                else:
+                    self.assertEqual(decdec, dec_p,
+                                     f"Expected Dec decimals={dec_p}, got {decdec}")
 
     def test_round_trip_conversion(self):
         """
@@ -157,74 +236,155 @@ class TestCoordinateParser(unittest.TestCase):
                                      ra_precision=5, dec_precision=5)
         
         # Instead of checking 1e-10 absolute difference, let's check the final string has 5 decimals:
-        ra_str, dec_str = roundtrip.split('\t')
+        ra_str, _, dec_str = roundtrip.partition('\t')
         
         # Each of RA, Dec in hmsdms should have 5 decimals in the seconds portion:
         # e.g. "12:34:56.78901 +45:23:45.67890"
         # We'll check the part after the last '.' has length=5
-        ra_secs = ra_str.split(':')[-1]  # "56.78901"
-        dec_secs = dec_str.split(':')[-1]  # "45.67890"
+        ra_secs = ra_str.rpartition(':')[2]  # "56.78901"
+        dec_secs = dec_str.rpartition(':')[2]  # "45.67890"
         
         # Verify the decimal part for the seconds
         if '.' in ra_secs:
-            self.assertEqual(len(ra_secs.split('.')[-1]), 5, f"RA seconds not at 5 decimals: {ra_secs}")
+            self.assertEqual(len(ra_secs.partition('.')[2]), 5, f"RA seconds not at 5 decimals: {ra_secs}")
         if '.' in dec_secs:
-            self.assertEqual(len(dec_secs.split('.')[-1]), 5, f"Dec seconds not at 5 decimals: {dec_secs}")
+            self.assertEqual(len(dec_secs.partition('.')[2]), 5, f"Dec seconds not at 5 decimals: {dec_secs}")
 
     def test_whitespace_variations(self):
-        base = "12:34:56 +45:23:45"
-        variations = [
-            "12:34:56    +45:23:45",
-            "12:34:56\t+45:23:45",
-            "12:34:56\n+45:23:45",
-            "12:34:56  \t  +45:23:45",
-            "12:34:56\r\n+45:23:45",
-        ]
-        expected = ra_dec_converter(base, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
-        for variant in variations:
-            out = ra_dec_converter(variant, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
-            self.assertEqual(out, expected)
+        outs = ra_dec_converter_batch(WHITESPACE_VARIATIONS, 'hmsdms', 'hmsdms',
+                                      ra_precision=2, dec_precision=2)
+        for variant, out in zip(WHITESPACE_VARIATIONS, outs):
+            with self.subTest(variant=variant):
+                self.assertEqual(out, self.base_hmsdms)
 
     def test_epoch_markers(self):
-        base = "12:34:56 +45:23:45"
-        markers = ["J2000", "j2000", "J2000.0", "j2000.0", "J 2000", "j 2000.0"]
-        expected = ra_dec_converter(base, 'hmsdms', 'degrees', ra_dec_delimiter=', ')
-        for mk in markers:
-            c = f"{mk} {base}"
-            out = ra_dec_converter(c, 'hmsdms', 'degrees', ra_dec_delimiter=', ')
-            self.assertEqual(out, expected)
+        outs = ra_dec_converter_batch([f"{mk} {BASE_COORD}" for mk in EPOCH_MARKERS], 'hmsdms', 'degrees',
+                                      ra_dec_delimiter=', ')
+        for mk, out in zip(EPOCH_MARKERS, outs):
+            with self.subTest(marker=mk):
+                self.assertEqual(out, self.base_degrees)
 
     def test_leading_zeros(self):
-        pairs = [
-            ("12:34:56 +45:23:45", "12:34:56 +45:23:45"),
-            ("02:34:56 +05:23:45", "02:34:56 +05:23:45"),
-            ("2:34:56 +5:23:45",   "02:34:56 +05:23:45"),
-        ]
-        for raw, canonical in pairs:
-            out_raw = ra_dec_converter(raw, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
-            out_canon = ra_dec_converter(canonical, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
-            self.assertEqual(out_raw, out_canon)
+        raws, canonicals = zip(*LEADING_ZERO_PAIRS)
+        outs_raw = ra_dec_converter_batch(raws, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
+        outs_canon = ra_dec_converter_batch(canonicals, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
+        for raw, out_raw, out_canon in zip(raws, outs_raw, outs_canon):
+            with self.subTest(raw=raw):
+                self.assertEqual(out_raw, out_canon)
 
     def test_boundary_values(self):
+        for c, expected in BOUNDARY_CASES:
+            with self.subTest(coord=c):
+                if expected is not None:
+                    try:
+                        out = ra_dec_converter(c, 'hmsdms', 'hmsdms')
+                    except ValueError as e:
+                        self.fail(f"Valid {c} raised ValueError: {e}")
+                    self.assertEqual(out, expected)
+                else:
+                    with self.assertRaises(ValueError):
+                        ra_dec_converter(c, 'hmsdms', 'hmsdms')
+
+    def test_seconds_rollover(self):
+        """Seconds that round up to 60 carry into minutes (and hours/degrees)."""
+        cases = [
+            ("23:59:59.999 +89:59:59.999", 'hmsdms', "00:00:00.00\t+90:00:00.00"),
+            ("12:34:59.996 -10:20:59.999", 'hmsdms', "12:35:00.00\t-10:21:00.00"),
+            ("12:34:59.996 -10:20:59.999", 'casa', "12:35:00.00\t-10.21.00.00"),
+        ]
+        for inp, out_fmt, exp in cases:
+            with self.subTest(inp=inp, output_format=out_fmt):
+                out = ra_dec_converter(inp, 'hmsdms', out_fmt, ra_precision=2, dec_precision=2)
+                self.assertEqual(out, exp)
+
+    def test_rounding_ties(self):
+        """Values sitting on a rounding tie keep their rounding direction."""
+        out = ra_dec_converter("08:46:6.0 -08:09:23.7956", 'hmsdms', 'degrees',
+                               ra_precision=2, dec_precision=2)
+        self.assertEqual(out, "131.53\t-8.16")
+
+    def test_sexagesimal_ties(self):
+        """Seconds that don't carry round exactly as round(ss, precision) does."""
+        cases = [
+            ("12:00:00.5 +10:00:02.5", 0, "12:00:01\t+10:00:03"),
+            ("12:00:00 -25:06:58.5", 0, "12:00:00\t-25:06:59"),
+            ("18:25:38.8 +64:14:58.9245", 3, "18:25:38.800\t+64:14:58.925"),
+        ]
+        for inp, prec, exp in cases:
+            with self.subTest(inp=inp, precision=prec):
+                out = ra_dec_converter(inp, 'hmsdms', 'hmsdms', ra_precision=prec, dec_precision=prec)
+                self.assertEqual(out, exp)
+
+    def test_cache_keeps_argument_types(self):
+        """A cached int-precision result is not reused for an equal float precision."""
+        coord = "12:34:56 +45:23:45"
+        self.assertEqual(ra_dec_converter(coord, 'hmsdms', 'degrees', ra_precision=2), "188.73\t+45")
+        with self.assertRaises(ValueError):
+            ra_dec_converter(coord, 'hmsdms', 'degrees', ra_precision=2.0)
+
+    def test_negative_precision(self):
+        """Sexagesimal output treats a negative precision like 0."""
+        coord = "12:34:56.78 +45:23:45.6"
+        for out_fmt in ('hmsdms', 'casa'):
+            with self.subTest(output_format=out_fmt):
+                self.assertEqual(
+                    ra_dec_converter(coord, 'hmsdms', out_fmt, ra_precision=-1, dec_precision=-1),
+                    ra_dec_converter(coord, 'hmsdms', out_fmt, ra_precision=0, dec_precision=0))
+
+    def test_single_axis(self):
+        """ra_only/dec_only ignore the other axis and accept a lone coordinate."""
+        coord = "12:34:56.78 +45:23:45.6"
+        self.assertEqual(ra_dec_converter(coord, 'hmsdms', 'hmsdms', ra_only=True), "12:34:56.78")
+        self.assertEqual(ra_dec_converter(coord, 'hmsdms', 'hmsdms', dec_only=True), "+45:23:45.6")
+        # The unused Dec is out of range, but only RA is asked for
+        self.assertEqual(ra_dec_converter("12:34:56.78 +95:00:00", 'hmsdms', 'hmsdms', ra_only=True),
+                         "12:34:56.78")
+        self.assertEqual(ra_dec_converter("12:34:56.78", 'hmsdms', 'hmsdms', ra_only=True),
+                         "12:34:56.78")
+        self.assertEqual(ra_dec_converter("-17.25", 'degrees', 'degrees', dec_only=True), "-17.25")
+        with self.assertRaises(ValueError):
+            ra_dec_converter("24:00:00 +45:00:00", 'hmsdms', 'hmsdms', ra_only=True)
+        # Unsigned space-separated RA+Dec is not one coordinate
+        with self.assertRaises(ValueError):
+            ra_dec_converter("12 34 56 45 23 45", 'hmsdms', 'hmsdms', dec_only=True)
+
+    def test_return_tuple(self):
+        """return_tuple gives unformatted (RA, Dec) floats for degrees output only."""
+        ra, dec = ra_dec_converter("12:00:00 -30:30:00", 'hmsdms', 'degrees', return_tuple=True)
+        self.assertEqual((ra, dec), (180.0, -30.5))
+        with self.assertRaises(ValueError):
+            ra_dec_converter("12:00:00 -30:30:00", 'hmsdms', 'hmsdms', return_tuple=True)
+
+    def test_batch_conversion(self):
+        """Batch conversion matches converting each row on its own, in order."""
         coords = [
-            ("00:00:00.000 +00:00:00.000", True),
-            ("23:59:59.999 +89:59:59.999", True),
-            ("24:00:00.000 +00:00:00.000", False),
-            # If your parser allows +90 exactly, you can set that True or False as you wish:
-            ("00:00:00.000 +90:00:00.000", True),
-            ("00:00:00.000 +90:00:00.001", False),
-            ("00:60:00.000 +00:00:00.000", False),
-            ("00:00:60.000 +00:00:00.000", False),
+            "12:34:56 +45:23:45",
+            "18:04:20.99 -29:31:08.9",
+            "J2000 02:34:56 +05:23:45",
         ]
-        for c, should_pass in coords:
-            if should_pass:
-                try:
-                    ra_dec_converter(c, 'hmsdms', 'hmsdms')
-                except ValueError as e:
-                    self.fail(f"Valid {c} raised ValueError: {e}")
-            else:
-                with self.assertRaises(ValueError):
-                    ra_dec_converter(c, 'hmsdms', 'hmsdms')
+        out = ra_dec_converter_batch(coords, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
+        expected = [ra_dec_converter(c, 'hmsdms', 'hmsdms', ra_precision=2, dec_precision=2)
+                    for c in coords]
+        self.assertEqual(out, expected)
+
+        with self.assertRaises(ValueError):
+            ra_dec_converter_batch(["12:34:56 +45:23:45", "24:00:00 +00:00:00"], 'hmsdms')
+
+    def test_degrees_batch(self):
+        """Numeric batch output agrees with the string converter, row by row."""
+        coords = ["12:34:56.789 +45:23:45.678", "18:04:20.99 -29:31:08.9"]
+        ra, dec = ra_dec_to_degrees_batch(coords, 'hmsdms')
+        self.assertEqual(len(ra), len(coords))
+        for i, c in enumerate(coords):
+            with self.subTest(coord=c):
+                ra_s, _, dec_s = ra_dec_converter(c, 'hmsdms', 'degrees', ra_precision=9,
+                                                  dec_precision=9, ra_dec_delimiter=', ').partition(', ')
+                ra_exp, dec_exp = float(ra_s), float(dec_s)
+                self.assertTrue(isclose(ra[i], ra_exp, rel_tol=1e-9))
+                self.assertTrue(isclose(dec[i], dec_exp, rel_tol=1e-9))
+
+        with self.assertRaises(ValueError):
+            ra_dec_to_degrees_batch(["00:00:00 +90:00:01"], 'hmsdms')
 
 
 if __name__ == '__main__':